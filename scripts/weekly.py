@@ -28,7 +28,7 @@ async def main() -> None:
     """Generate weekly digest and send to Telegram."""
     settings = get_settings()
     processor = ClaudeProcessor(settings.vault_path, settings.todoist_api_key)
-    git = VaultGit(settings.vault_path)
+    git = VaultGit(settings.vault_path, settings.github_token)
 
     logger.info("Starting weekly digest generation...")
 
@@ -41,7 +41,7 @@ async def main() -> None:
         report = result.get("report", "No output")
         logger.info("Weekly digest generated successfully")
         # Commit any changes
-        git.commit_and_push("chore: weekly digest")
+        await git.commit_and_push_async("chore: weekly digest")
 
     # Send to Telegram
     bot = Bot(
@@ -25,14 +25,11 @@ async def main() -> None:
     # Ensure vault is synchronized
     if settings.vault_git_url:
         logger.info("Syncing vault from %s...", settings.vault_git_url)
-        git = VaultGit(settings.vault_path)
-        # Run sync in thread as it is blocking subprocess call
+        git = VaultGit(settings.vault_path, settings.github_token)
         try:
-            await asyncio.to_thread(
-                git.ensure_vault,
+            await git.ensure_vault_async(
                 git_url=settings.vault_git_url,
                 branch=settings.vault_git_branch,
-                token=settings.github_token,
             )
         except Exception as e:
             logger.error("Failed to sync vault: %s", e)
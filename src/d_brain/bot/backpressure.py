@@ -0,0 +1,77 @@
+"""Per-user job queues with backpressure."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class UserQueue:
+    """Runs each user's jobs one at a time, in arrival order.
+
+    A worker task is started when a user submits the first job and exits once
+    their queue is drained, so idle users hold no tasks.
+
+    Jobs are not coalesced: each voice is its own Telegram message with its
+    own reply, and separate Ogg/Opus files can't be sent to Deepgram as one
+    upload, so serialising them is what removes the concurrent requests.
+    """
+
+    def __init__(self, threshold: int = 2, cooldown: float = 10.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._queues: dict[int, asyncio.Queue[Job]] = {}
+        self._workers: dict[int, asyncio.Task[None]] = {}
+        self._last_busy: dict[int, float] = {}
+
+    def submit(self, user_id: int, job: Job) -> bool:
+        """Enqueue a job for the user.
+
+        Args:
+            user_id: Telegram user ID
+            job: Coroutine factory to run once earlier jobs are done
+
+        Returns:
+            True if the queue is backed up and the user should be told to
+            wait (at most once per cooldown period)
+        """
+        queue = self._queues.setdefault(user_id, asyncio.Queue())
+        queue.put_nowait(job)
+        if user_id not in self._workers:
+            self._workers[user_id] = asyncio.create_task(self._worker(user_id, queue))
+
+        if queue.qsize() < self.threshold:
+            return False
+        now = time.monotonic()
+        if now - self._last_busy.get(user_id, 0.0) < self.cooldown:
+            return False
+        self._last_busy[user_id] = now
+        return True
+
+    async def stop(self) -> None:
+        """Wait for every queued job to finish.
+
+        Telegram has already acknowledged the queued updates, so dropping
+        them on shutdown would lose those messages for good.
+        """
+        while self._workers:
+            await asyncio.gather(*self._workers.values())
+
+    async def _worker(self, user_id: int, queue: asyncio.Queue[Job]) -> None:
+        """Run the user's jobs serially until the queue is empty."""
+        try:
+            while not queue.empty():
+                job = queue.get_nowait()
+                try:
+                    await job()
+                except Exception:
+                    logger.exception("Queued job failed for user %s", user_id)
+        finally:
+            # No await between the empty check and cleanup, so a concurrent
+            # submit either lands in this queue or starts a fresh worker
+            self._queues.pop(user_id, None)
+            self._workers.pop(user_id, None)
@@ -0,0 +1,11 @@
+"""Helpers for Telegram file downloads."""
+
+from collections.abc import AsyncIterator
+
+from aiogram import Bot
+
+
+def stream_file(bot: Bot, file_path: str) -> AsyncIterator[bytes]:
+    """Stream a Telegram file in chunks instead of buffering it in memory."""
+    url = bot.session.api.file_url(bot.token, file_path)
+    return bot.session.stream_content(url=url)
@@ -5,32 +5,42 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
 from d_brain.bot.states import DoCommandState
+from d_brain.services.git_queue import GitCommitQueue
+from d_brain.services.processor import ClaudeProcessor
+from d_brain.services.session import SessionStore
+from d_brain.services.storage import VaultStorage
 
 router = Router(name="buttons")
 
 
 @router.message(F.text == "📊 Статус")
-async def btn_status(message: Message) -> None:
+async def btn_status(
+    message: Message, storage: VaultStorage, session_store: SessionStore
+) -> None:
     """Handle Status button."""
     from d_brain.bot.handlers.commands import cmd_status
 
-    await cmd_status(message)
+    await cmd_status(message, storage, session_store)
 
 
 @router.message(F.text == "⚙️ Обработать")
-async def btn_process(message: Message) -> None:
+async def btn_process(
+    message: Message, processor: ClaudeProcessor, git_queue: GitCommitQueue
+) -> None:
     """Handle Process button."""
     from d_brain.bot.handlers.process import cmd_process
 
-    await cmd_process(message)
+    await cmd_process(message, processor, git_queue)
 
 
 @router.message(F.text == "📅 Неделя")
-async def btn_weekly(message: Message) -> None:
+async def btn_weekly(
+    message: Message, processor: ClaudeProcessor, git_queue: GitCommitQueue
+) -> None:
     """Handle Weekly button."""
     from d_brain.bot.handlers.weekly import cmd_weekly
 
-    await cmd_weekly(message)
+    await cmd_weekly(message, processor, git_queue)
 
 
 @router.message(F.text == "✨ Запрос")
@@ -1,6 +1,5 @@
 """Command handlers for /start, /help, /status."""
 
-import asyncio
 import logging
 from datetime import date
 
@@ -9,10 +8,8 @@ from aiogram.filters import Command
 from aiogram.types import Message
 
 from d_brain.bot.keyboards import get_main_keyboard
-from d_brain.config import get_settings
 from d_brain.services.session import SessionStore
 from d_brain.services.storage import VaultStorage
-from d_brain.utils import handle_rate_limit, RateLimitException
 
 router = Router(name="commands")
 logger = logging.getLogger(__name__)
@@ -21,45 +18,22 @@ logger = logging.getLogger(__name__)
 @router.message(Command("start"))
 async def cmd_start(message: Message) -> None:
     """Handle /start command."""
-    try:
-        await message.answer(
-            "<b>d-brain</b> - твой голосовой дневник\n\n"
-            "Отправляй мне:\n"
-            "🎤 Голосовые сообщения\n"
-            "💬 Текст\n"
-            "📷 Фото\n"
-            "↩️ Пересланные сообщения\n\n"
-            "Всё будет сохранено и обработано.\n\n"
-            "<b>Команды:</b>\n"
-            "/status - статус сегодняшнего дня\n"
-            "/process - обработать записи\n"
-            "/do - выполнить произвольный запрос\n"
-            "/weekly - недельный дайджест\n"
-            "/help - справка",
-            reply_markup=get_main_keyboard(),
-        )
-    except Exception as e:
-        logger.exception("Error in /start command")
-        if "429" in str(e).lower() or "rate limit" in str(e).lower():
-            # If rate limit, try to send without keyboard
-            await asyncio.sleep(1)
-            await message.answer(
-                "<b>d-brain</b> - твой голосовой дневник\n\n"
-                "Отправляй мне:\n"
-                "🎤 Голосовые сообщения\n"
-                "💬 Текст\n"
-                "📷 Фото\n"
-                "↩️ Пересланные сообщения\n\n"
-                "Всё будет сохранено и обработано.\n\n"
-                "<b>Команды:</b>\n"
-                "/status - статус сегодняшнего дня\n"
-                "/process - обработать записи\n"
-                "/do - выполнить произвольный запрос\n"
-                "/weekly - недельный дайджест\n"
-                "/help - справка"
-            )
-        else:
-            raise
+    await message.answer(
+        "<b>d-brain</b> - твой голосовой дневник\n\n"
+        "Отправляй мне:\n"
+        "🎤 Голосовые сообщения\n"
+        "💬 Текст\n"
+        "📷 Фото\n"
+        "↩️ Пересланные сообщения\n\n"
+        "Всё будет сохранено и обработано.\n\n"
+        "<b>Команды:</b>\n"
+        "/status - статус сегодняшнего дня\n"
+        "/process - обработать записи\n"
+        "/do - выполнить произвольный запрос\n"
+        "/weekly - недельный дайджест\n"
+        "/help - справка",
+        reply_markup=get_main_keyboard(),
+    )
 
 
 @router.message(Command("help"))
@@ -83,15 +57,14 @@ async def cmd_help(message: Message) -> None:
 
 
 @router.message(Command("status"))
-async def cmd_status(message: Message) -> None:
+async def cmd_status(
+    message: Message, storage: VaultStorage, session_store: SessionStore
+) -> None:
     """Handle /status command."""
     user_id = message.from_user.id if message.from_user else 0
-    settings = get_settings()
-    storage = VaultStorage(settings.vault_path)
 
     # Log command
-    session = SessionStore(settings.vault_path)
-    session.append(user_id, "command", cmd="/status")
+    session_store.append(user_id, "command", cmd="/status")
 
     today = date.today()
     content = storage.read_daily(today)
@@ -112,7 +85,7 @@ async def cmd_status(message: Message) -> None:
 
     # Get weekly stats from session
     week_stats = ""
-    stats = session.get_stats(user_id, days=7)
+    stats = session_store.get_stats(user_id, days=7)
     if stats:
         week_stats = "\n\n<b>За 7 дней:</b>"
         for entry_type, count in sorted(stats.items()):
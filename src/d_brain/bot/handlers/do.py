@@ -8,9 +8,9 @@ from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
+from d_brain.bot.files import stream_file
 from d_brain.bot.formatters import format_process_report
 from d_brain.bot.states import DoCommandState
-from d_brain.config import get_settings
 from d_brain.services.processor import ClaudeProcessor
 from d_brain.services.storage import VaultStorage
 from d_brain.services.transcription import DeepgramTranscriber
@@ -21,13 +21,19 @@ logger = logging.getLogger(__name__)
 
 
 @router.message(Command("do"))
-async def cmd_do(message: Message, command: CommandObject, state: FSMContext) -> None:
+async def cmd_do(
+    message: Message,
+    command: CommandObject,
+    state: FSMContext,
+    processor: ClaudeProcessor,
+    storage: VaultStorage,
+) -> None:
     """Handle /do command."""
     user_id = message.from_user.id if message.from_user else 0
 
     # Check for inline text: /do move overdue tasks
     if command.args:
-        await process_request(message, command.args, user_id)
+        await process_request(message, processor, storage, command.args, user_id)
         return
 
     # Otherwise, wait for next message
@@ -39,7 +45,14 @@ async def cmd_do(message: Message, command: CommandObject, state: FSMContext) ->
 
 
 @router.message(DoCommandState.waiting_for_input)
-async def handle_do_input(message: Message, bot: Bot, state: FSMContext) -> None:
+async def handle_do_input(
+    message: Message,
+    bot: Bot,
+    state: FSMContext,
+    processor: ClaudeProcessor,
+    storage: VaultStorage,
+    transcriber: DeepgramTranscriber,
+) -> None:
     """Handle voice/text input after /do command."""
     await state.clear()
 
@@ -48,8 +61,6 @@ async def handle_do_input(message: Message, bot: Bot, state: FSMContext) -> None
     # Handle voice input
     if message.voice:
         await message.chat.do(action="typing")
-        settings = get_settings()
-        transcriber = DeepgramTranscriber(settings.deepgram_api_key)
 
         try:
             file = await bot.get_file(message.voice.file_id)
@@ -57,13 +68,7 @@ async def handle_do_input(message: Message, bot: Bot, state: FSMContext) -> None
                 await message.answer("❌ Не удалось скачать голосовое")
                 return
 
-            file_bytes = await bot.download_file(file.file_path)
-            if not file_bytes:
-                await message.answer("❌ Не удалось скачать голосовое")
-                return
-
-            audio_bytes = file_bytes.read()
-            prompt = await transcriber.transcribe(audio_bytes)
+            prompt = await transcriber.transcribe(stream_file(bot, file.file_path))
         except Exception as e:
             logger.exception("Failed to transcribe voice for /do")
             await message.answer(f"❌ Не удалось транскрибировать: {e}")
@@ -82,17 +87,20 @@ async def handle_do_input(message: Message, bot: Bot, state: FSMContext) -> None
         return
 
     user_id = message.from_user.id if message.from_user else 0
-    await process_request(message, prompt, user_id)
+    await process_request(message, processor, storage, prompt, user_id)
 
 
-async def process_request(message: Message, prompt: str, user_id: int = 0) -> None:
+async def process_request(
+    message: Message,
+    processor: ClaudeProcessor,
+    storage: VaultStorage,
+    prompt: str,
+    user_id: int = 0,
+) -> None:
     """Process the user's request with LLM."""
     status_msg = await message.answer("⏳ Выполняю...")
 
-    settings = get_settings()
-    
     # 1. Save request to Vault first!
-    storage = VaultStorage(settings.vault_path)
     timestamp = datetime.now()
     try:
         storage.append_to_daily(prompt, timestamp, "[request]")
@@ -100,12 +108,6 @@ async def process_request(message: Message, prompt: str, user_id: int = 0) -> No
         logger.error(f"Failed to save request to vault: {e}")
         # Continue anyway to try processing
 
-    processor = ClaudeProcessor(
-        settings.vault_path,
-        settings.todoist_api_key,
-        settings.groq_api_key,
-    )
-
     try:
         # 2. Execute with rate limit handling
         report = await handle_rate_limit(
@@ -115,13 +117,12 @@ async def process_request(message: Message, prompt: str, user_id: int = 0) -> No
             delay=2.0,
             max_retries=3
         )
+    except RateLimitException:
+        logger.exception("Execute prompt failed")
+        report = {"error": "⚠️ Слишком много запросов. Запрос сохранен, но не обработан.", "processed_entries": 0}
     except Exception as e:
         logger.exception("Execute prompt failed")
-        error_msg = str(e)
-        if "rate limit" in error_msg.lower() or "429" in error_msg.lower():
-            report = {"error": "⚠️ Слишком много запросов. Запрос сохранен, но не обработан.", "processed_entries": 0}
-        else:
-            report = {"error": str(e), "processed_entries": 0}
+        report = {"error": str(e), "processed_entries": 0}
 
     formatted = format_process_report(report)
     try:
@@ -6,7 +6,6 @@ from datetime import datetime
 from aiogram import Router
 from aiogram.types import Message
 
-from d_brain.config import get_settings
 from d_brain.services.session import SessionStore
 from d_brain.services.storage import VaultStorage
 
@@ -15,14 +14,13 @@ logger = logging.getLogger(__name__)
 
 
 @router.message(lambda m: m.forward_origin is not None)
-async def handle_forward(message: Message) -> None:
+async def handle_forward(
+    message: Message, storage: VaultStorage, session_store: SessionStore
+) -> None:
     """Handle forwarded messages."""
     if not message.from_user:
         return
 
-    settings = get_settings()
-    storage = VaultStorage(settings.vault_path)
-
     # Determine source name
     source_name = "Unknown"
     origin = message.forward_origin
@@ -45,8 +43,7 @@ async def handle_forward(message: Message) -> None:
     storage.append_to_daily(content, timestamp, msg_type)
 
     # Log to session
-    session = SessionStore(settings.vault_path)
-    session.append(
+    session_store.append(
         message.from_user.id,
         "forward",
         text=content,
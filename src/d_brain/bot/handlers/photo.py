@@ -6,7 +6,6 @@ from datetime import datetime
 from aiogram import Bot, Router
 from aiogram.types import Message
 
-from d_brain.config import get_settings
 from d_brain.services.session import SessionStore
 from d_brain.services.storage import VaultStorage
 
@@ -15,14 +14,13 @@ logger = logging.getLogger(__name__)
 
 
 @router.message(lambda m: m.photo is not None)
-async def handle_photo(message: Message, bot: Bot) -> None:
+async def handle_photo(
+    message: Message, bot: Bot, storage: VaultStorage, session_store: SessionStore
+) -> None:
     """Handle photo messages."""
     if not message.photo or not message.from_user:
         return
 
-    settings = get_settings()
-    storage = VaultStorage(settings.vault_path)
-
     # Get largest photo
     photo = message.photo[-1]
 
@@ -61,8 +59,7 @@ async def handle_photo(message: Message, bot: Bot) -> None:
         storage.append_to_daily(content, timestamp, "[photo]")
 
         # Log to session
-        session = SessionStore(settings.vault_path)
-        session.append(
+        session_store.append(
             message.from_user.id,
             "photo",
             path=relative_path,
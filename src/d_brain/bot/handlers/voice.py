@@ -2,11 +2,13 @@
 
 import logging
 from datetime import datetime
+from functools import partial
 
 from aiogram import Bot, Router
 from aiogram.types import Message
 
-from d_brain.config import get_settings
+from d_brain.bot.backpressure import UserQueue
+from d_brain.bot.files import stream_file
 from d_brain.services.session import SessionStore
 from d_brain.services.storage import VaultStorage
 from d_brain.services.transcription import DeepgramTranscriber
@@ -16,17 +18,42 @@ router = Router(name="voice")
 logger = logging.getLogger(__name__)
 
 
+BUSY_MESSAGE = "⏳ Ещё обрабатываю предыдущие голосовые, подождите..."
+
+
 @router.message(lambda m: m.voice is not None)
-async def handle_voice(message: Message, bot: Bot) -> None:
-    """Handle voice messages."""
+async def handle_voice(
+    message: Message,
+    bot: Bot,
+    voice_queue: UserQueue,
+    storage: VaultStorage,
+    session_store: SessionStore,
+    transcriber: DeepgramTranscriber,
+) -> None:
+    """Handle voice messages.
+
+    Voices are queued per user and transcribed one at a time, in order.
+    """
     if not message.voice or not message.from_user:
         return
 
-    await message.chat.do(action="typing")
+    job = partial(process_voice, message, bot, storage, session_store, transcriber)
+    if voice_queue.submit(message.from_user.id, job):
+        await message.answer(BUSY_MESSAGE)
+
+
+async def process_voice(
+    message: Message,
+    bot: Bot,
+    storage: VaultStorage,
+    session_store: SessionStore,
+    transcriber: DeepgramTranscriber,
+) -> None:
+    """Transcribe voice message and save it to the daily file."""
+    if not message.voice or not message.from_user:
+        return
 
-    settings = get_settings()
-    storage = VaultStorage(settings.vault_path)
-    transcriber = DeepgramTranscriber(settings.deepgram_api_key)
+    await message.chat.do(action="typing")
 
     try:
         file = await bot.get_file(message.voice.file_id)
@@ -34,16 +61,14 @@ async def handle_voice(message: Message, bot: Bot) -> None:
             await message.answer("Failed to download voice message")
             return
 
-        file_bytes = await bot.download_file(file.file_path)
-        if not file_bytes:
-            await message.answer("Failed to download voice message")
-            return
+        file_path = file.file_path
 
-        audio_bytes = file_bytes.read()
-        
-        # Handle potential rate limiting when transcribing
+        # Handle potential rate limiting when transcribing. Audio is streamed
+        # from Telegram to Deepgram; each attempt opens a fresh download.
         try:
-            transcript = await handle_rate_limit(transcriber.transcribe, audio_bytes)
+            transcript = await handle_rate_limit(
+                lambda: transcriber.transcribe(stream_file(bot, file_path))
+            )
         except RateLimitException as e:
             logger.error(f"Rate limit exceeded during transcription: {e}")
             await message.answer("⚠️ Слишком много запросов. Попробуйте немного позже.")
@@ -57,8 +82,7 @@ async def handle_voice(message: Message, bot: Bot) -> None:
         storage.append_to_daily(transcript, timestamp, "[voice]")
 
         # Log to session
-        session = SessionStore(settings.vault_path)
-        session.append(
+        session_store.append(
             message.from_user.id,
             "voice",
             text=transcript,
@@ -66,27 +90,9 @@ async def handle_voice(message: Message, bot: Bot) -> None:
             msg_id=message.message_id,
         )
 
-        try:
-            await handle_rate_limit(
-                message.answer, 
-                f"🎤 {transcript}\n\n✓ Сохранено",
-                delay=2.0,
-                max_retries=3
-            )
-        except Exception as e:
-            if "429" in str(e).lower() or "rate limit" in str(e).lower():
-                logger.warning("Rate limit hit when sending voice response")
-            else:
-                logger.error(f"Error sending response: {e}")
-                
+        await message.answer(f"🎤 {transcript}\n\n✓ Сохранено")
         logger.info("Voice message saved: %d chars", len(transcript))
 
     except Exception as e:
         logger.exception("Error processing voice message")
-        try:
-            await message.answer(f"Error: {e}")
-        except Exception as response_error:
-            if "429" in str(response_error).lower() or "rate limit" in str(response_error).lower():
-                logger.warning("Rate limit hit when sending error response")
-            else:
-                logger.error(f"Error sending error response: {response_error}")
+        await message.answer(f"Error: {e}")
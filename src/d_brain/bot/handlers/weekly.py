@@ -1,6 +1,5 @@
 """Weekly digest command handler."""
 
-import asyncio
 import logging
 
 from aiogram import Router
@@ -8,48 +7,40 @@ from aiogram.filters import Command
 from aiogram.types import Message
 
 from d_brain.bot.formatters import format_process_report
-from d_brain.config import get_settings
-from d_brain.services.git import VaultGit
+from d_brain.services.git_queue import GitCommitQueue
 from d_brain.services.processor import ClaudeProcessor
-from d_brain.utils import handle_rate_limit
+from d_brain.utils import RateLimitException, handle_rate_limit
 
 router = Router(name="weekly")
 logger = logging.getLogger(__name__)
 
 
 @router.message(Command("weekly"))
-async def cmd_weekly(message: Message) -> None:
+async def cmd_weekly(
+    message: Message, processor: ClaudeProcessor, git_queue: GitCommitQueue
+) -> None:
     """Handle /weekly command - generate weekly digest."""
     user_id = message.from_user.id if message.from_user else "unknown"
     logger.info("Weekly digest triggered by user %s", user_id)
 
     status_msg = await message.answer("⏳ Генерирую недельный дайджест...")
 
-    settings = get_settings()
-    processor = ClaudeProcessor(
-        settings.vault_path,
-        settings.todoist_api_key,
-        settings.groq_api_key,
-    )
-    git = VaultGit(settings.vault_path)
-
     try:
         report = await handle_rate_limit(
             processor.generate_weekly,
             delay=2.0,
             max_retries=3
         )
+    except RateLimitException:
+        logger.exception("Weekly digest failed")
+        report = {"error": "⚠️ Слишком много запросов. Попробуйте создать отчет чуть позже.", "processed_entries": 0}
     except Exception as e:
         logger.exception("Weekly digest failed")
-        error_msg = str(e).lower()
-        if "429" in error_msg or "rate limit" in error_msg:
-            report = {"error": "⚠️ Слишком много запросов. Попробуйте создать отчет чуть позже.", "processed_entries": 0}
-        else:
-            report = {"error": str(e), "processed_entries": 0}
+        report = {"error": str(e), "processed_entries": 0}
 
-    # Commit any changes
+    # Schedule commit of any changes in the background
     if "error" not in report:
-        await asyncio.to_thread(git.commit_and_push, "chore: weekly digest")
+        await git_queue.put("chore: weekly digest")
 
     formatted = format_process_report(report)
     try:
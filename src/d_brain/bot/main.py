@@ -10,17 +10,28 @@ from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import Update
 
+from d_brain.bot.backpressure import UserQueue
+from d_brain.bot.throttle import ChatThrottle, create_throttle_middleware
 from d_brain.config import Settings
+from d_brain.services.git import VaultGit
+from d_brain.services.git_queue import GitCommitQueue
+from d_brain.services.processor import ClaudeProcessor
+from d_brain.services.session import SessionStore
+from d_brain.services.storage import VaultStorage
+from d_brain.services.transcription import DeepgramTranscriber
 
 logger = logging.getLogger(__name__)
 
 
 def create_bot(settings: Settings) -> Bot:
     """Create and configure the Telegram bot."""
-    return Bot(
+    bot = Bot(
         token=settings.telegram_bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+    # Pace outgoing requests to stay within Telegram's flood limits
+    bot.session.middleware(create_throttle_middleware(ChatThrottle()))
+    return bot
 
 
 def create_dispatcher() -> Dispatcher:
@@ -88,8 +99,35 @@ async def run_bot(settings: Settings) -> None:
     # Always add auth middleware for security (it handles allow_all_users internally)
     dp.update.middleware(create_auth_middleware(settings))
 
+    # Vault commits are batched by a background task, injected into handlers
+    git_queue = GitCommitQueue(VaultGit(settings.vault_path, settings.github_token))
+    dp["git_queue"] = git_queue
+    git_queue.start()
+
+    # Voice messages are transcribed serially per user
+    voice_queue = UserQueue(
+        threshold=settings.voice_queue_threshold,
+        cooldown=settings.voice_busy_cooldown,
+    )
+    dp["voice_queue"] = voice_queue
+
+    # Services hold no per-message state: build them once, inject into handlers
+    processor = ClaudeProcessor(
+        settings.vault_path,
+        settings.todoist_api_key,
+        settings.groq_api_key,
+    )
+    dp["processor"] = processor
+    dp["storage"] = VaultStorage(settings.vault_path)
+    dp["session_store"] = SessionStore(settings.vault_path)
+    dp["transcriber"] = DeepgramTranscriber(settings.deepgram_api_key)
+
     logger.info("Starting bot polling...")
     try:
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
     finally:
+        # Drain queued voices first: they need the bot session to download
+        await voice_queue.stop()
+        await git_queue.stop()
+        await processor.aclose()
         await bot.session.close()
@@ -0,0 +1,119 @@
+"""Outgoing Telegram API throttling."""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import Response
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows ~30 messages/sec bot-wide and ~1 message/sec per chat;
+# stay a bit below the global cap
+GLOBAL_RATE = 25
+CHAT_RATE = 1
+CHAT_BURST = 3
+CHAT_SWEEP_INTERVAL = 60.0  # seconds between evictions of idle chat buckets
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per ``per`` seconds."""
+
+    def __init__(
+        self, rate: float, per: float = 1.0, capacity: float | None = None
+    ) -> None:
+        self.fill_rate = rate / per
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.fill_rate)
+        self._updated = now
+
+    def is_idle(self) -> bool:
+        """True if nobody is waiting and the bucket has refilled completely."""
+        if self._lock.locked():
+            return False
+        self._refill(time.monotonic())
+        return self._tokens >= self.capacity
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # Lock is held while sleeping so waiters are served in FIFO order
+        async with self._lock:
+            while True:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.fill_rate)
+
+
+class ChatThrottle:
+    """Bot-wide token bucket combined with a bucket per chat."""
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_RATE,
+        chat_rate: float = CHAT_RATE,
+        chat_burst: float = CHAT_BURST,
+    ) -> None:
+        self.global_bucket = TokenBucket(global_rate)
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self._chat_buckets: dict[int | str, TokenBucket] = {}
+        self._last_sweep = time.monotonic()
+
+    def _evict_idle(self) -> None:
+        """Drop chat buckets that are full and unused.
+
+        A fresh bucket starts full, so forgetting an idle one changes nothing.
+        """
+        now = time.monotonic()
+        if now - self._last_sweep < CHAT_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        idle = [key for key, bucket in self._chat_buckets.items() if bucket.is_idle()]
+        for key in idle:
+            del self._chat_buckets[key]
+
+    async def acquire(self, chat_id: int | str | None = None) -> None:
+        """Wait for a slot for the given chat and bot-wide."""
+        self._evict_idle()
+        if chat_id is not None:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(self.chat_rate, capacity=self.chat_burst)
+                self._chat_buckets[chat_id] = bucket
+            await bucket.acquire()
+        await self.global_bucket.acquire()
+
+
+def create_throttle_middleware(throttle: ChatThrottle) -> Any:
+    """Create session middleware that paces all outgoing API requests."""
+
+    async def throttle_middleware(
+        make_request: NextRequestMiddlewareType[Any],
+        bot: Bot,
+        method: TelegramMethod[Any],
+    ) -> Response[Any]:
+        chat_id = getattr(method, "chat_id", None)
+        await throttle.acquire(chat_id)
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            # Shouldn't happen with pacing in place, but honour it once if it does
+            logger.warning("Telegram flood control, retrying in %ss", e.retry_after)
+            await asyncio.sleep(e.retry_after)
+            await throttle.acquire(chat_id)
+            return await make_request(bot, method)
+
+    return throttle_middleware
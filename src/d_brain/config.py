@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -43,6 +44,14 @@ class Settings(BaseSettings):
         default="",
         description="GitHub token for vault authentication",
     )
+    voice_queue_threshold: int = Field(
+        default=2,
+        description="Queued voice messages per user before a 'please wait' reply",
+    )
+    voice_busy_cooldown: float = Field(
+        default=10.0,
+        description="Minimum seconds between 'please wait' replies to one user",
+    )
 
     @property
     def daily_path(self) -> Path:
@@ -60,6 +69,7 @@ class Settings(BaseSettings):
         return self.vault_path / "thoughts"
 
 
+@lru_cache
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get application settings instance (loaded once, then cached)."""
     return Settings()
@@ -1,6 +1,9 @@
 """Git automation service for vault."""
 
+import asyncio
+import base64
 import logging
+import os
 import subprocess
 from pathlib import Path
 
@@ -8,31 +11,62 @@ logger = logging.getLogger(__name__)
 
 
 class VaultGit:
-    """Service for git operations on vault."""
+    """Service for git operations on vault.
 
-    def __init__(self, vault_path: Path) -> None:
+    Git runs in asyncio subprocesses, so the methods are awaited without
+    blocking the event loop.
+    """
+
+    def __init__(self, vault_path: Path, token: str = "") -> None:
         self.vault_path = Path(vault_path)
+        self.token = token
 
-    def _run_git(self, *args: str) -> subprocess.CompletedProcess[str]:
-        """Run git command in vault directory."""
-        return subprocess.run(
-            ["git", *args],
-            cwd=self.vault_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+    def _auth_env(self) -> dict[str, str]:
+        """Environment passing the token to a single network command.
 
-    def get_status(self) -> str:
-        """Get git status."""
-        result = self._run_git("status", "--porcelain")
-        return result.stdout
+        The token goes in an HTTP header set through git's environment
+        config, so it is neither written to .git/config nor visible in the
+        process command line.
+        """
+        if not self.token:
+            return {}
+        credentials = base64.b64encode(f"x-access-token:{self.token}".encode()).decode()
+        return {
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraHeader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+        }
+
+    async def _run_git_async(
+        self, *args: str, auth: bool = False
+    ) -> subprocess.CompletedProcess[str]:
+        """Run git command in vault directory without blocking the event loop.
 
-    def has_changes(self) -> bool:
-        """Check if there are uncommitted changes."""
-        return bool(self.get_status().strip())
+        Args:
+            args: Git arguments
+            auth: Pass the token, for commands that talk to the remote
+        """
+        # Untranslated output, so messages like "nothing to commit" match
+        env = {**os.environ, "LC_ALL": "C"}
+        if auth:
+            env.update(self._auth_env())
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=self.vault_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        stdout, stderr = await proc.communicate()
+        return subprocess.CompletedProcess(
+            ["git", *args],
+            proc.returncode if proc.returncode is not None else -1,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
 
-    def commit_changes(self, message: str) -> bool:
+    async def commit_changes_async(self, message: str) -> bool:
         """Stage all changes and commit.
 
         Args:
@@ -41,32 +75,32 @@ class VaultGit:
         Returns:
             True if commit was made, False otherwise
         """
-        if not self.has_changes():
-            logger.info("No changes to commit")
-            return False
-
         # Stage all changes
-        add_result = self._run_git("add", "-A")
+        add_result = await self._run_git_async("add", "-A")
         if add_result.returncode != 0:
             logger.error("Git add failed: %s", add_result.stderr)
             return False
 
-        # Commit
-        commit_result = self._run_git("commit", "-m", message)
+        # Commit; git itself tells us when there is nothing to commit, so no
+        # separate `git status` is needed beforehand
+        commit_result = await self._run_git_async("commit", "-m", message)
         if commit_result.returncode != 0:
+            if "nothing to commit" in commit_result.stdout + commit_result.stderr:
+                logger.info("No changes to commit")
+                return False
             logger.error("Git commit failed: %s", commit_result.stderr)
             return False
 
         logger.info("Committed: %s", message)
         return True
 
-    def push(self) -> bool:
+    async def push_async(self) -> bool:
         """Push to remote.
 
         Returns:
             True if push was successful
         """
-        result = self._run_git("push")
+        result = await self._run_git_async("push", auth=True)
         if result.returncode != 0:
             logger.error("Git push failed: %s", result.stderr)
             return False
@@ -74,7 +108,7 @@ class VaultGit:
         logger.info("Pushed to remote")
         return True
 
-    def commit_and_push(self, message: str) -> bool:
+    async def commit_and_push_async(self, message: str) -> bool:
         """Commit all changes and push.
 
         Args:
@@ -83,11 +117,11 @@ class VaultGit:
         Returns:
             True if successful
         """
-        if self.commit_changes(message):
-            return self.push()
+        if await self.commit_changes_async(message):
+            return await self.push_async()
         return True  # No changes is not an error
 
-    def ensure_vault(
+    async def ensure_vault_async(
         self, 
         git_url: str, 
         branch: str = "main", 
@@ -100,7 +134,8 @@ class VaultGit:
         Args:
             git_url: Repository URL
             branch: Branch to use
-            token: GitHub token for authentication
+            token: GitHub token for authentication (overrides the one
+                given to the constructor)
             username: Git user.name for commits
             email: Git user.email for commits
             
@@ -111,12 +146,8 @@ class VaultGit:
             logger.warning("No git URL provided, skipping vault sync")
             return False
 
-        # Prepare auth URL if token provided
-        auth_url = git_url
-        if token and "@" not in git_url:
-            # Inject token into URL: https://TOKEN@github.com/...
-            scheme, limit, path = git_url.partition("://")
-            auth_url = f"{scheme}{limit}{token}@{path}"
+        if token:
+            self.token = token
 
         # Check if already cloned
         if not (self.vault_path / ".git").exists():
@@ -124,13 +155,16 @@ class VaultGit:
             # Ensure parent dir exists
             self.vault_path.mkdir(parents=True, exist_ok=True)
             
-            # Clone
-            result = subprocess.run(
-                ["git", "clone", "--branch", branch, auth_url, "."],
-                cwd=self.vault_path,
-                capture_output=True,
-                text=True,
-                check=False
+            # Shallow clone: the bot only needs the current tree, not history
+            result = await self._run_git_async(
+                "clone",
+                "--depth=1",
+                "--single-branch",
+                "--branch",
+                branch,
+                git_url,
+                ".",
+                auth=True,
             )
             if result.returncode != 0:
                 # If directory not empty, try cloning into temp and moving? 
@@ -140,16 +174,40 @@ class VaultGit:
             logger.info("Vault cloned successfully")
         else:
             logger.info("Vault already exists, pulling changes...")
-            # Set remote url with token just in case
-            self._run_git("remote", "set-url", "origin", auth_url)
-            result = self._run_git("pull", "origin", branch)
+            # Reset origin to the plain URL; this also scrubs tokens that
+            # older versions embedded in it
+            await self._run_git_async("remote", "set-url", "origin", git_url)
+
+            # With nothing local to preserve, fetch only the new tip and move
+            # to it, which avoids merging against truncated shallow history
+            status = await self._run_git_async("status", "--porcelain")
+            ahead = await self._run_git_async(
+                "rev-list", "--count", f"origin/{branch}..HEAD"
+            )
+            if (
+                status.returncode == 0
+                and not status.stdout.strip()
+                and ahead.stdout.strip() == "0"
+            ):
+                result = await self._run_git_async(
+                    "fetch", "--depth=1", "origin", branch, auth=True
+                )
+                if result.returncode == 0:
+                    result = await self._run_git_async(
+                        "reset", "--hard", f"origin/{branch}"
+                    )
+            else:
+                logger.warning("Vault has unpushed changes, doing a regular pull")
+                result = await self._run_git_async(
+                    "pull", "origin", branch, auth=True
+                )
             if result.returncode != 0:
                 logger.error("Git pull failed: %s", result.stderr)
                 return False
             logger.info("Vault updated")
 
         # Configure local git user
-        self._run_git("config", "user.name", username)
-        self._run_git("config", "user.email", email)
+        await self._run_git_async("config", "user.name", username)
+        await self._run_git_async("config", "user.email", email)
         
         return True
@@ -0,0 +1,79 @@
+"""Background git committer that batches vault commits."""
+
+import asyncio
+import contextlib
+import logging
+
+from d_brain.services.git import VaultGit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 5.0  # seconds
+
+
+class GitCommitQueue:
+    """Queue of commit messages drained by a single background task.
+
+    Handlers enqueue a message and return immediately. The committer waits
+    for a short debounce window after the first message, so a burst of
+    commands results in one commit and one push instead of one per command.
+    """
+
+    def __init__(self, git: VaultGit, debounce: float = DEFAULT_DEBOUNCE) -> None:
+        self.git = git
+        self.debounce = debounce
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background committer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._committer_loop())
+
+    async def stop(self) -> None:
+        """Flush pending commits and stop the committer task."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def put(self, message: str) -> None:
+        """Schedule a commit with the given message."""
+        await self._queue.put(message)
+
+    async def _committer_loop(self) -> None:
+        """Drain the queue, committing each debounced batch at once."""
+        while True:
+            message = await self._queue.get()
+            if message is None:
+                return
+
+            # Let a burst of commands settle; cut short on shutdown
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.debounce)
+
+            messages = [message]
+            stop = False
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stop = True
+                elif item not in messages:
+                    messages.append(item)
+
+            await self._commit(messages)
+            if stop:
+                return
+
+    async def _commit(self, messages: list[str]) -> None:
+        """Commit and push a batch of queued messages as one commit."""
+        commit_message = messages[0]
+        if len(messages) > 1:
+            commit_message = "chore: vault sync\n\n" + "\n".join(messages)
+        try:
+            await self.git.commit_and_push_async(commit_message)
+        except Exception:
+            logger.exception("Background git commit failed")
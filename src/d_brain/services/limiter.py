@@ -0,0 +1,65 @@
+"""Client-side rate limiting for external APIs."""
+
+import asyncio
+import time
+from collections import deque
+from types import TracebackType
+
+
+class SlidingWindow:
+    """Admit at most ``rate`` requests in any ``window`` seconds.
+
+    Usage::
+
+        async with limiter:
+            await client.post(...)
+    """
+
+    def __init__(self, rate: int, window: float = 60.0) -> None:
+        self.rate = rate
+        self.window = window
+        self._timestamps: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request fits in the window and record it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.window:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.rate:
+                    self._timestamps.append(now)
+                    return
+                # Sleep until the oldest request leaves the window
+                await asyncio.sleep(self._timestamps[0] + self.window - now)
+
+    async def __aenter__(self) -> "SlidingWindow":
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_limiters: dict[tuple[str, str], SlidingWindow] = {}
+
+
+def get_limiter(
+    service: str, api_key: str, rate: int, window: float = 60.0
+) -> SlidingWindow:
+    """Get the shared limiter for a service and API key.
+
+    Quotas are enforced per key, so every client using the same key must
+    share one limiter.
+    """
+    limiter = _limiters.get((service, api_key))
+    if limiter is None:
+        limiter = SlidingWindow(rate, window)
+        _limiters[(service, api_key)] = limiter
+    return limiter
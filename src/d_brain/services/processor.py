@@ -1,19 +1,36 @@
 """LLM processing service using Groq API."""
 
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import date
+import re
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from d_brain.services.limiter import get_limiter
 from d_brain.services.session import SessionStore
+from d_brain.utils import RateLimitException, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL = "llama-3.3-70b-versatile"
 DEFAULT_TIMEOUT = 120  # seconds
+GROQ_RATE_LIMIT = 30  # requests per minute per API key
+
+# Telegram HTML -> Obsidian Markdown substitutions, applied in order
+_HTML_TO_MARKDOWN = [
+    (re.compile(r"<b>(.*?)</b>"), r"**\1**"),
+    (re.compile(r"<i>(.*?)</i>"), r"*\1*"),
+    (re.compile(r"<code>(.*?)</code>"), r"`\1`"),
+    (re.compile(r"<s>(.*?)</s>"), r"~~\1~~"),
+    (re.compile(r"</?u>"), ""),
+    (re.compile(r'<a href="([^"]+)">([^<]+)</a>'), r"[\2](\1)"),
+]
 
 
 class ClaudeProcessor:
@@ -30,6 +47,34 @@ class ClaudeProcessor:
         # We initialize storage internally to ensure consistent path logic
         from d_brain.services.storage import VaultStorage
         self.storage = VaultStorage(self.vault_path)
+        self.session_store = SessionStore(self.vault_path)
+        self._client: httpx.AsyncClient | None = None
+        self._limiter = get_limiter("groq", groq_api_key, GROQ_RATE_LIMIT)
+
+    async def __aenter__(self) -> "ClaudeProcessor":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get HTTP client, creating it on first use.
+
+        The client is kept for the processor's lifetime so that retries and
+        subsequent calls reuse the open connection to Groq.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=DEFAULT_TIMEOUT,
+                headers={"Authorization": f"Bearer {self.groq_api_key}"},
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
         """Call Groq API for chat completion.
@@ -44,11 +89,6 @@ class ClaudeProcessor:
         if not self.groq_api_key:
             return "❌ GROQ_API_KEY не настроен. Добавьте ключ в переменные окружения."
 
-        headers = {
-            "Authorization": f"Bearer {self.groq_api_key}",
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "model": GROQ_MODEL,
             "messages": [
@@ -59,49 +99,99 @@ class ClaudeProcessor:
             "max_tokens": 2000,
         }
 
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            try:
-                response = await client.post(GROQ_API_URL, json=payload, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
-            except httpx.HTTPStatusError as e:
-                # Re-raise with specific message for 429 to be caught by handle_rate_limit
-                if e.response.status_code == 429:
-                    raise  # Will be caught by handle_rate_limit mechanism
-                raise
+        client = self._get_client()
+        try:
+            async with self._limiter:
+                response = await client.post(GROQ_API_URL, json=payload)
+            response.raise_for_status()
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
+        except httpx.HTTPStatusError as e:
+            # Surface 429 with the server's Retry-After hint for handle_rate_limit
+            if e.response.status_code == 429:
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                raise RateLimitException(
+                    f"Groq rate limit exceeded: {e}", retry_after=retry_after
+                ) from e
+            raise
 
     def _get_session_context(self, user_id: int) -> str:
         """Get today's session context."""
         if user_id == 0:
             return ""
 
-        session = SessionStore(self.vault_path)
-        today_entries = session.get_today(user_id)
+        today_entries = self.session_store.get_today(user_id)
         if not today_entries:
             return ""
 
-        lines = ["=== СЕГОДНЯШНИЕ ЗАПИСИ ==="]
-        for entry in today_entries[-10:]:
-            ts = entry.get("ts", "")[11:16]
-            entry_type = entry.get("type", "unknown")
-            text = entry.get("text", "")[:80]
-            if text:
-                lines.append(f"{ts} [{entry_type}] {text}")
-        lines.append("=== КОНЕЦ ЗАПИСЕЙ ===\n")
-        return "\n".join(lines)
+        lines = [
+            f"{entry.get('ts', '')[11:16]} [{entry.get('type', 'unknown')}] {text}"
+            for entry in today_entries[-10:]
+            if (text := entry.get("text", "")[:80])
+        ]
+        return "\n".join(
+            ["=== СЕГОДНЯШНИЕ ЗАПИСИ ===", *lines, "=== КОНЕЦ ЗАПИСЕЙ ===\n"]
+        )
+
+    def _process_state_file(self, day: date) -> Path:
+        return self.vault_path / ".d-brain" / "state" / f"{day.isoformat()}.json"
+
+    def _ensure_state_dir(self, state_dir: Path) -> None:
+        """Create the state dir, keeping .d-brain/ out of the vault repo.
+
+        The .gitignore lives inside .d-brain/ itself, so it works for any
+        cloned vault without touching the user's own ignore rules.
+        """
+        state_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = self.vault_path / ".d-brain" / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding="utf-8")
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _load_process_state(self, day: date) -> dict[str, Any] | None:
+        """Load offset, prefix hash and report of the last /process run."""
+        path = self._process_state_file(day)
+        if not path.exists():
+            return None
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+            return {
+                "offset": int(state["offset"]),
+                "hash": str(state["hash"]),
+                "report": str(state["report"]),
+            }
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed process state %s", path)
+            return None
+
+    def _save_process_state(self, day: date, content: str, report: str) -> None:
+        """Remember how much of the daily file has been processed.
+
+        A hash of the processed part is stored with the offset, so an edit
+        to earlier entries (e.g. made in Obsidian and pulled in) is noticed.
+        """
+        path = self._process_state_file(day)
+        self._ensure_state_dir(path.parent)
+        state = {
+            "offset": len(content),
+            "hash": self._content_hash(content),
+            "report": report,
+        }
+        path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+
+        # Only the current day's state is ever read again
+        for old in path.parent.glob("*.json"):
+            if old.stem < day.isoformat():
+                old.unlink(missing_ok=True)
 
     def _html_to_markdown(self, html: str) -> str:
         """Convert Telegram HTML to Obsidian Markdown."""
-        import re
-
         text = html
-        text = re.sub(r"<b>(.*?)</b>", r"**\1**", text)
-        text = re.sub(r"<i>(.*?)</i>", r"*\1*", text)
-        text = re.sub(r"<code>(.*?)</code>", r"`\1`", text)
-        text = re.sub(r"<s>(.*?)</s>", r"~~\1~~", text)
-        text = re.sub(r"</?u>", "", text)
-        text = re.sub(r'<a href="([^"]+)">([^<]+)</a>', r"[\2](\1)", text)
+        for pattern, replacement in _HTML_TO_MARKDOWN:
+            text = pattern.sub(replacement, text)
         return text
 
     def _save_weekly_summary(self, report_html: str, week_date: date) -> Path:
@@ -120,7 +210,11 @@ week: {year}-W{week:02d}
 ---
 
 """
-        summary_path.write_text(frontmatter + content)
+        # Write both parts separately rather than concatenating a second copy
+        # of the whole report
+        with summary_path.open("wb") as f:
+            f.write(frontmatter.encode("utf-8"))
+            f.write(content.encode("utf-8"))
         logger.info("Weekly summary saved to %s", summary_path)
         return summary_path
 
@@ -155,11 +249,37 @@ week: {year}-W{week:02d}
 - Будь кратким — лимит Telegram 4096 символов
 - Пиши на русском языке"""
 
-        user_prompt = f"""Сегодня {day}. Обработай записи за день:
+        # Only send entries added since the last /process, together with the
+        # previous report, so prompt size doesn't grow with every call.
+        # If the already processed part changed, start over with the full file.
+        state = self._load_process_state(day)
+        offset = state["offset"] if state else 0
+        if (
+            state
+            and 0 < offset <= len(daily_content)
+            and self._content_hash(daily_content[:offset]) == state["hash"]
+        ):
+            new_content = daily_content[offset:]
+            if not new_content.strip():
+                return {"report": state["report"], "processed_entries": 0}
+
+            user_prompt = f"""Сегодня {day}. Часть записей ты уже обработал, вот итог:
+
+{state["report"]}
+
+Новые записи с момента прошлой обработки:
+
+{new_content}
+
+Обнови итог с учётом новых записей."""
+        else:
+            user_prompt = f"""Сегодня {day}. Обработай записи за день:
 
 {daily_content}"""
 
         output = await self._call_llm(system_prompt, user_prompt)
+        if self.groq_api_key:
+            self._save_process_state(day, daily_content, output)
         return {"report": output, "processed_entries": 1}
 
     async def execute_prompt(self, user_prompt: str, user_id: int = 0) -> dict[str, Any]:
@@ -190,15 +310,17 @@ week: {year}-W{week:02d}
         """Generate weekly digest with LLM."""
         today = date.today()
 
-        # Collect daily files for the last 7 days
-        week_content = []
-        for i in range(7):
-            from datetime import timedelta
-            day = today - timedelta(days=i)
-            # Use Storage service
-            content = self.storage.read_daily(day)
-            if content:
-                week_content.append(f"--- {day} ---\n{content}")
+        # Collect daily files for the last 7 days, reading them concurrently
+        # off the event loop
+        days = [today - timedelta(days=i) for i in range(7)]
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self.storage.read_daily, day) for day in days)
+        )
+        week_content = [
+            f"--- {day} ---\n{content}"
+            for day, content in zip(days, contents, strict=True)
+            if content
+        ]
 
         if not week_content:
             return {"error": "Нет записей за последнюю неделю", "processed_entries": 0}
@@ -229,7 +351,7 @@ week: {year}-W{week:02d}
 
         # Save to summaries/
         try:
-            self._save_weekly_summary(output, today)
+            await asyncio.to_thread(self._save_weekly_summary, output, today)
         except Exception as e:
             logger.warning("Failed to save weekly summary: %s", e)
 
@@ -1,8 +1,22 @@
 """Vault storage service for saving entries."""
 
+import threading
+import time
 from datetime import date, datetime
 from pathlib import Path
 
+DAILY_CACHE_TTL = 5.0  # seconds
+DAILY_CACHE_SIZE = 32
+
+# Shared by all VaultStorage instances, so a write through one invalidates
+# reads through the others. Safe because d-brain is the only writer of
+# daily files. read_daily runs in worker threads too, so a per-key version,
+# bumped on every append, keeps a read that raced a write from caching the
+# old content.
+_daily_cache: dict[tuple[Path, date], tuple[float, str]] = {}
+_daily_versions: dict[tuple[Path, date], int] = {}
+_daily_lock = threading.Lock()
+
 
 class VaultStorage:
     """Service for storing entries in Obsidian vault."""
@@ -23,11 +37,29 @@ class VaultStorage:
         return self.daily_path / f"{day.isoformat()}.md"
 
     def read_daily(self, day: date) -> str:
-        """Read content of daily file."""
+        """Read content of daily file.
+
+        Results are cached briefly so that handlers reading the same day in
+        quick succession don't hit the disk each time.
+        """
+        key = (self.vault_path, day)
+        now = time.monotonic()
+        with _daily_lock:
+            cached = _daily_cache.get(key)
+            if cached is not None and now - cached[0] < DAILY_CACHE_TTL:
+                return cached[1]
+            version = _daily_versions.get(key, 0)
+
         file_path = self.get_daily_file(day)
-        if not file_path.exists():
-            return ""
-        return file_path.read_text(encoding="utf-8")
+        content = file_path.read_text(encoding="utf-8") if file_path.exists() else ""
+
+        with _daily_lock:
+            # Skip caching if the file was appended to while we were reading
+            if _daily_versions.get(key, 0) == version:
+                if len(_daily_cache) >= DAILY_CACHE_SIZE:
+                    _daily_cache.pop(next(iter(_daily_cache)))
+                _daily_cache[key] = (now, content)
+        return content
 
     def append_to_daily(
         self,
@@ -50,6 +82,10 @@ class VaultStorage:
 
         with file_path.open("a", encoding="utf-8") as f:
             f.write(entry)
+        key = (self.vault_path, timestamp.date())
+        with _daily_lock:
+            _daily_versions[key] = _daily_versions.get(key, 0) + 1
+            _daily_cache.pop(key, None)
 
     def get_attachments_dir(self, day: date) -> Path:
         """Get attachments directory for given date."""
@@ -1,15 +1,18 @@
 """Deepgram transcription service."""
 
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
 
 from deepgram import AsyncDeepgramClient
+from deepgram.core.api_error import ApiError
+from deepgram.core.request_options import RequestOptions
 
-logger = logging.getLogger(__name__)
+from d_brain.services.limiter import get_limiter
+from d_brain.utils import RateLimitException, parse_retry_after
 
+logger = logging.getLogger(__name__)
 
-class RateLimitException(Exception):
-    """Raised when API rate limit is exceeded."""
-    pass
+DEEPGRAM_RATE_LIMIT = 100  # requests per minute per API key
 
 
 class DeepgramTranscriber:
@@ -17,12 +20,16 @@ class DeepgramTranscriber:
 
     def __init__(self, api_key: str) -> None:
         self.client = AsyncDeepgramClient(api_key=api_key)
+        self.limiter = get_limiter("deepgram", api_key, DEEPGRAM_RATE_LIMIT)
 
-    async def transcribe(self, audio_bytes: bytes) -> str:
-        """Transcribe audio bytes to text.
+    async def transcribe(self, audio: bytes | AsyncIterator[bytes]) -> str:
+        """Transcribe audio to text.
 
         Args:
-            audio_bytes: Audio file content
+            audio: Audio file content, or an async stream of its chunks
+                which is forwarded to Deepgram as it arrives. A stream can
+                only be sent once, so the SDK's own retries are disabled for
+                it; retry with a fresh stream via handle_rate_limit instead.
 
         Returns:
             Transcribed text
@@ -30,16 +37,23 @@ class DeepgramTranscriber:
         Raises:
             Exception: If transcription fails
         """
-        logger.info("Starting transcription, audio size: %d bytes", len(audio_bytes))
+        request_options: RequestOptions | None = None
+        if isinstance(audio, bytes):
+            logger.info("Starting transcription, audio size: %d bytes", len(audio))
+        else:
+            logger.info("Starting transcription of streamed audio")
+            request_options = {"max_retries": 0}
 
         try:
-            response = await self.client.listen.v1.media.transcribe_file(
-                request=audio_bytes,
-                model="nova-3",
-                language="ru",
-                punctuate=True,
-                smart_format=True,
-            )
+            async with self.limiter:
+                response = await self.client.listen.v1.media.transcribe_file(
+                    request=audio,
+                    model="nova-3",
+                    language="ru",
+                    punctuate=True,
+                    smart_format=True,
+                    request_options=request_options,
+                )
 
             transcript = (
                 response.results.channels[0].alternatives[0].transcript
@@ -51,11 +65,20 @@ class DeepgramTranscriber:
 
             logger.info("Transcription complete: %d chars", len(transcript))
             return transcript
-        except Exception as e:
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "too many requests" in error_str:
+        except ApiError as e:
+            if e.status_code == 429:
                 logger.error("Deepgram rate limit exceeded: %s", e)
-                raise RateLimitException(f"Deepgram rate limit exceeded: {e}")
-            else:
-                logger.exception("Transcription failed")
-                raise
+                headers = {k.lower(): v for k, v in (e.headers or {}).items()}
+                raise RateLimitException(
+                    f"Deepgram rate limit exceeded: {e}",
+                    retry_after=parse_retry_after(headers.get("retry-after")),
+                ) from e
+            logger.exception("Transcription failed")
+            raise
+        except Exception:
+            logger.exception("Transcription failed")
+            raise
+        finally:
+            # Don't leave an abandoned download open on the bot's HTTP session
+            if isinstance(audio, AsyncGenerator):
+                await audio.aclose()
@@ -2,14 +2,69 @@
 
 import asyncio
 import logging
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any, Callable, Coroutine
 
 logger = logging.getLogger(__name__)
 
 
 class RateLimitException(Exception):
-    """Raised when API rate limit is exceeded."""
-    pass
+    """Raised when API rate limit is exceeded.
+
+    Attributes:
+        retry_after: Seconds the server asked us to wait, if it said so
+    """
+
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def _compute_retry_wait(
+    error: RateLimitException,
+    attempt: int,
+    delay: float,
+    max_delay: float,
+    jitter: float,
+) -> float:
+    """Compute how long to sleep before the next retry attempt."""
+    if error.retry_after is not None:
+        # Server told us when to come back - trust it, plus a little
+        # jitter so concurrent callers don't all return at the same instant.
+        # Not capped by max_delay: retrying earlier is a guaranteed 429.
+        return error.retry_after + random.uniform(0, delay * jitter)
+
+    # Exponential backoff, capped and jittered so that
+    # concurrent callers don't retry in lockstep
+    wait_time = min(max_delay, delay * (2 ** attempt))
+    return wait_time * (1 + random.uniform(-jitter, jitter))
 
 
 async def handle_rate_limit(
@@ -17,45 +72,58 @@ async def handle_rate_limit(
     *args, 
     delay: float = 1.0, 
     max_retries: int = 3,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
     **kwargs
 ) -> Any:
     """
-    Handle API rate limiting with exponential backoff.
-    
+    Handle API rate limiting with jittered exponential backoff.
+
+    Only :class:`RateLimitException` triggers a retry. If it carries a
+    ``retry_after`` hint (from the server's Retry-After header), that delay
+    is used instead of the computed backoff. A hint longer than
+    ``max_delay`` (e.g. an exhausted daily quota) is raised immediately
+    rather than slept through.
+
     Args:
         func: Async function to call
         args: Arguments to pass to the function
         delay: Initial delay between retries (seconds)
         max_retries: Maximum number of retry attempts
+        max_delay: Upper bound for a single backoff (seconds)
+        jitter: Relative random spread of each backoff (0.5 = ±50%)
         kwargs: Keyword arguments to pass to the function
     
     Returns:
         Result of the function call
         
     Raises:
-        RateLimitException: If max retries reached
+        RateLimitException: If max retries reached or the server asked
+            to wait longer than max_delay
     """
+    error: RateLimitException | None = None
     for attempt in range(max_retries + 1):
         try:
             return await func(*args, **kwargs)
-        except Exception as e:
-            # Check if it's a rate limit error (HTTP 429 or similar)
-            error_str = str(e).lower()
-            if "429" in error_str or "rate limit" in error_str or "too many requests" in error_str:
-                if attempt < max_retries:
-                    wait_time = delay * (2 ** attempt)  # Exponential backoff
-                    logger.warning(
-                        f"Rate limit hit (attempt {attempt + 1}/{max_retries}). "
-                        f"Waiting {wait_time}s before retry..."
-                    )
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"Max retries reached for rate limit error: {e}")
-                    raise RateLimitException(f"Rate limit exceeded after {max_retries} retries: {e}")
-            else:
-                # Re-raise if it's not a rate limit error
-                raise e
-
-    # This should not be reached, but included for completeness
-    raise RateLimitException(f"Function failed after {max_retries} retries")
+        except RateLimitException as e:
+            error = e
+            if e.retry_after is not None and e.retry_after > max_delay:
+                logger.error(
+                    f"Rate limit asks to wait {e.retry_after:.0f}s, "
+                    f"more than {max_delay:.0f}s; giving up"
+                )
+                raise
+            if attempt < max_retries:
+                wait_time = _compute_retry_wait(
+                    e, attempt, delay, max_delay, jitter
+                )
+                logger.warning(
+                    f"Rate limit hit (attempt {attempt + 1}/{max_retries}). "
+                    f"Waiting {wait_time:.1f}s before retry..."
+                )
+                await asyncio.sleep(wait_time)
+    else:
+        logger.error(f"Max retries reached for rate limit error: {error}")
+        raise RateLimitException(
+            f"Rate limit exceeded after {max_retries} retries: {error}"
+        ) from error